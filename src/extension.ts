@@ -576,6 +576,13 @@ class JulesChatProvider implements vscode.WebviewViewProvider {
                 const cliToolbox = document.getElementById('cli-toolbox');
 
                 const commands = ${cmdList};
+
+                // Static halves of the per-card action buttons, hoisted out of the render loop.
+                const RUN_BTN_OPEN = '<button class="cmd-btn" data-cmd="';
+                const RUN_BTN_CLOSE = '" onclick="sendCmd(this.dataset.cmd)">Run</button>';
+                const COPY_BTN_OPEN = '<button class="cmd-btn" data-copy="';
+                const COPY_BTN_CLOSE = '" onclick="copyToClipboard(this.dataset.copy)">Copy</button>';
+
                 let currentSessionId = null;
 
                 // --- INITIALIZATION ---
@@ -596,16 +603,17 @@ class JulesChatProvider implements vscode.WebviewViewProvider {
                 }
 
                 function renderCommands() {
-                    // ⚡ Bolt Optimization: Build HTML string once to avoid layout thrashing
-                    const html = commands.map(c => {
-                        let actionHtml = '';
-                        if (c.actionId) {
-                            actionHtml += \`<button class="cmd-btn" data-cmd="\${escapeHtml(c.actionId || '')}" onclick="sendCmd(this.dataset.cmd)">Run</button>\`;
-                        }
+                    // ⚡ Bolt Optimization: Build HTML string once to avoid layout thrashing.
+                    // Fill a preallocated array by index and assign innerHTML a single time.
+                    const n = commands.length;
+                    const parts = new Array(n);
+                    for (let i = 0; i < n; i++) {
+                        const c = commands[i];
                         const copyText = c.usage || c.command || '';
-                        actionHtml += \`<button class="cmd-btn" data-copy="\${escapeHtml(copyText)}" onclick="copyToClipboard(this.dataset.copy)">Copy</button>\`;
+                        const actionHtml = (c.actionId ? RUN_BTN_OPEN + escapeHtml(c.actionId) + RUN_BTN_CLOSE : '')
+                            + COPY_BTN_OPEN + escapeHtml(copyText) + COPY_BTN_CLOSE;
 
-                        return \`
+                        parts[i] = \`
                         <div class="cmd-card">
                             <div class="cmd-header">
                                 <span class="cmd-name">\${escapeHtml(c.command || '')}</span>
@@ -614,8 +622,8 @@ class JulesChatProvider implements vscode.WebviewViewProvider {
                             <div class="cmd-desc">\${escapeHtml(c.description || '')}</div>
                             \${c.usage ? \`<div class="cmd-usage">\${escapeHtml(c.usage)}</div>\` : ''}
                         </div>\`;
-                    }).join('');
-                    commandsView.innerHTML = html;
+                    }
+                    commandsView.innerHTML = parts.join('');
                 }
 
                 function copyToClipboard(text) {
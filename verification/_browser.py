@@ -0,0 +1,50 @@
+
+import os
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+
+# Subsystems none of the verify pages need; trims browser start-up.
+LAUNCH_ARGS = ['--disable-extensions', '--disable-background-networking', '--disable-gpu']
+
+# The verify pages only carry inline CSS, so anything heavier is never asserted on.
+_BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def new_context(browser):
+    context = await browser.new_context()
+    await context.route('**/*', _block_heavy_resources)
+    return context
+
+@asynccontextmanager
+async def shared_browser():
+    # One Playwright + Browser per run; each verify function opens its own
+    # BrowserContext on it. Attaches to a warm browser (see browser_daemon.py)
+    # when CDP_ENDPOINT is set, otherwise launches a local one.
+    async with async_playwright() as p:
+        cdp_endpoint = os.environ.get('CDP_ENDPOINT')
+        if cdp_endpoint:
+            # Leave the daemon's browser running on exit.
+            yield await p.chromium.connect_over_cdp(cdp_endpoint)
+            return
+        browser = await p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+@asynccontextmanager
+async def shared_context():
+    # The verify pages are read-only local HTML with no cookies or storage, so
+    # checks can share one context and just open their own page on it. Use
+    # new_context() directly for a check that genuinely needs isolation.
+    async with shared_browser() as browser:
+        context = await new_context(browser)
+        try:
+            yield context
+        finally:
+            await context.close()
@@ -0,0 +1,29 @@
+
+import time
+from playwright.sync_api import sync_playwright
+from _browser import LAUNCH_ARGS
+
+# Keeps one headless Chromium alive so verify scripts can attach to it over CDP
+# instead of paying a cold browser start each run:
+#
+#   python verification/browser_daemon.py &
+#   CDP_ENDPOINT=http://localhost:9222 python verification/verify_commands.py
+CDP_PORT = 9222
+
+def run_daemon():
+    with sync_playwright() as p:
+        browser = p.chromium.launch(
+            headless=True,
+            args=LAUNCH_ARGS + [f'--remote-debugging-port={CDP_PORT}', '--remote-allow-origins=*'],
+        )
+        print(f'Chromium listening on http://localhost:{CDP_PORT}')
+        try:
+            while browser.is_connected():
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            browser.close()
+
+if __name__ == "__main__":
+    run_daemon()
@@ -0,0 +1,17 @@
+
+import asyncio
+from _browser import shared_context
+from verify_commands import verify_commands_render
+
+# Independent browser checks; each opens its own page on one shared context so
+# they can run concurrently.
+VERIFIERS = [
+    verify_commands_render,
+]
+
+async def run_all():
+    async with shared_context() as context:
+        await asyncio.gather(*(verify(context) for verify in VERIFIERS))
+
+if __name__ == "__main__":
+    asyncio.run(run_all())
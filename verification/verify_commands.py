@@ -1,78 +1,89 @@
 
+import asyncio
 import json
-from playwright.sync_api import sync_playwright
-
-def verify_commands_render():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        # Load the mock HTML directly (since we can't easily spin up VS Code webview)
-        # We will create a mock HTML file that includes the CSS/JS structure from extension.ts
-        # but injects our actual commandData.ts content (simulating what extension.ts does)
-
-        # First, read commandData.ts to extract the list
-        with open('src/commandData.ts', 'r') as f:
-            content = f.read()
-            # Extract JSON array part roughly or just import it if it was json
-            # Since it's TS, we'll strip the export and just eval it or use a mock for verification
-            # Actually, let's just use a representative subset or try to parse it.
-            # Parsing TS in python is hard.
-            # I will instead create a mock HTML that represents the structure we want to verify.
-            pass
+import os
+from _browser import shared_context
 
-        # Let's create a simple HTML file that mimics the structure in extension.ts
-        # and verify the styling/rendering of a few commands.
-        html_content = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                :root { --bg: #1e1e1e; --text: #cccccc; --jules-bg: #252526; --vscode-button-secondaryBackground: #3a3d41; }
-                body { font-family: sans-serif; background: var(--bg); color: var(--text); }
-                .cmd-card { background: var(--jules-bg); border-radius: 6px; padding: 10px; margin-bottom: 8px; border: 1px solid #333; }
-                .cmd-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 4px; }
-                .cmd-name { font-family: monospace; font-weight: bold; color: #40a6ff; }
-                .cmd-desc { font-size: 12px; margin-bottom: 6px; }
-                .cmd-usage { font-family: monospace; font-size: 10px; background: #333; padding: 4px; border-radius: 4px; }
-                .cmd-actions { display: flex; gap: 8px; }
-                .cmd-btn { padding: 2px 8px; font-size: 11px; cursor: pointer; background: var(--vscode-button-secondaryBackground); color: white; border: none; }
-            </style>
-        </head>
-        <body>
-            <div id="commands-view">
-                <div class="cmd-card">
-                    <div class="cmd-header">
-                        <span class="cmd-name">jules login</span>
-                        <div class="cmd-actions">
-                            <button class="cmd-btn">Run</button>
-                            <button class="cmd-btn">Copy</button>
-                        </div>
-                    </div>
-                    <div class="cmd-desc">Authenticate the CLI with your Google account.</div>
+# A simple page that mimics the commands view structure in extension.ts, used to
+# verify the styling/rendering of a few commands. Kept as a plain module-level
+# literal (no f-string brace escaping) so it can be diffed against the real template.
+_MOCK_VIEW_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <style>
+        :root { --bg: #1e1e1e; --text: #cccccc; --jules-bg: #252526; --vscode-button-secondaryBackground: #3a3d41; }
+        body { font-family: sans-serif; background: var(--bg); color: var(--text); }
+        .cmd-card { background: var(--jules-bg); border-radius: 6px; padding: 10px; margin-bottom: 8px; border: 1px solid #333; }
+        .cmd-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 4px; }
+        .cmd-name { font-family: monospace; font-weight: bold; color: #40a6ff; }
+        .cmd-desc { font-size: 12px; margin-bottom: 6px; }
+        .cmd-usage { font-family: monospace; font-size: 10px; background: #333; padding: 4px; border-radius: 4px; }
+        .cmd-actions { display: flex; gap: 8px; }
+        .cmd-btn { padding: 2px 8px; font-size: 11px; cursor: pointer; background: var(--vscode-button-secondaryBackground); color: white; border: none; }
+    </style>
+</head>
+<body>
+    <div id="commands-view">
+        <div class="cmd-card">
+            <div class="cmd-header">
+                <span class="cmd-name">jules login</span>
+                <div class="cmd-actions">
+                    <button class="cmd-btn">Run</button>
+                    <button class="cmd-btn">Copy</button>
                 </div>
-                <div class="cmd-card">
-                    <div class="cmd-header">
-                        <span class="cmd-name">Configure API Key</span>
-                        <div class="cmd-actions">
-                            <button class="cmd-btn">Run</button>
-                            <button class="cmd-btn">Copy</button>
-                        </div>
-                    </div>
-                    <div class="cmd-desc">Manually enter your Jules API Key for direct API mode.</div>
+            </div>
+            <div class="cmd-desc">Authenticate the CLI with your Google account.</div>
+        </div>
+        <div class="cmd-card">
+            <div class="cmd-header">
+                <span class="cmd-name">Configure API Key</span>
+                <div class="cmd-actions">
+                    <button class="cmd-btn">Run</button>
+                    <button class="cmd-btn">Copy</button>
                 </div>
             </div>
-        </body>
-        </html>
-        """
+            <div class="cmd-desc">Manually enter your Jules API Key for direct API mode.</div>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+async def verify_commands_render(context):
+    page = await context.new_page()
 
+    # Load the mock HTML directly (since we can't easily spin up VS Code webview).
+    # Parsing commandData.ts from Python is impractical, so rather than reading
+    # the source on every run we render a representative subset of commands.
+
+    # Hand the HTML straight to Chromium; only dump it to disk when debugging.
+    if os.environ.get('VERIFY_DEBUG'):
         with open('verification/mock_view.html', 'w') as f:
-            f.write(html_content)
+            f.write(_MOCK_VIEW_HTML)
 
-        page.goto('file://' + os.path.abspath('verification/mock_view.html'))
-        page.screenshot(path='verification/commands_verification.png')
+    await page.set_content(_MOCK_VIEW_HTML, wait_until='domcontentloaded')
+
+    # Read everything we assert on in a single evaluate round-trip rather than
+    # one CDP query per check (and without serialising the DOM via page.content()).
+    r = await page.evaluate("""() => {
+        const names = Array.from(document.querySelectorAll('.cmd-name'), n => n.textContent);
+        return {
+            count: document.querySelectorAll('.cmd-card').length,
+            hasLogin: names.includes('jules login'),
+            hasApiKey: names.includes('Configure API Key'),
+        };
+    }""")
+    assert r['count'] == 2 and r['hasLogin'] and r['hasApiKey'], r
+
+    # Only the commands panel is under test, so skip encoding the rest of the viewport.
+    await page.locator('#commands-view').screenshot(path='verification/commands_verification.png')
+
+    await page.close()
+
+async def main():
+    async with shared_context() as context:
+        await verify_commands_render(context)
 
-import os
 if __name__ == "__main__":
-    verify_commands_render()
+    asyncio.run(main())